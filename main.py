@@ -1,8 +1,5 @@
-import asyncio
 import sys
-import logging
 import argparse
-from src.main import run
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the application CLI.")
@@ -15,13 +12,19 @@ if __name__ == "__main__":
 
     environment = args.env
 
+    import asyncio
+    import logging
+    from src.main import run
+    from src.loop import new_event_loop
+
     if environment == "dev":
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
         logging.info(f"Starting application in '{environment}' environment...")
     else:
         print("Starting...")
     try:
-        asyncio.run(run())
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(run())
 
         if environment == "dev":
             logging.info("Application finished successfully.")
@@ -1,15 +1,43 @@
-__all__ = ["get_agent"]
-from src.llm import get_llm_client
-from src.mcp import get_mcp
+__all__ = ["get_agent", "reset_agent"]
+import asyncio
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from src.config import get_config
+
+_agent_configs = {}
+_agents = {}
 
 
 def get_agent(agent_id: str):
     """
-    Get the agent instance based on the agent_id.
+    Get the agent instance based on the agent_id. Agents are created once per process and shared
+    until reset_agent is called.
+    """
+    agent = _agents.get(agent_id)
+    if agent is None:
+        agent = _agents[agent_id] = create_agent(agent_id)
+    return agent
+
+
+def reset_agent(agent_id: str):
+    """
+    Discard the shared agent for agent_id so the next get_agent call creates a fresh one, with new
+    LLM and MCP clients. The discarded agent is returned so the caller can close it.
     """
+    return _agents.pop(agent_id, None)
+
+
+def create_agent(agent_id: str):
+    """
+    Create a new agent instance based on the agent_id.
+    """
+    from src.llm import get_llm_client
+    from src.mcp import get_mcp
 
     agent_config = get_agent_config(agent_id)
-    if agent_config["model_provider"] == "google":
+    if agent_config.model_provider == "google":
 
         mcp_client = get_mcp(agent_id)
 
@@ -21,88 +49,173 @@ def get_agent(agent_id: str):
         )
 
     else:
-        raise ValueError(f"Unsupported model provider: {agent_config['model_provider']}")
+        raise ValueError(f"Unsupported model provider: {agent_config.model_provider}")
 
 
 def get_agent_config(agent_id: str):
     """
     Get the configuration for a given agent_id (key) from the agent_config.yml file at the project root.
+    The result is cached until the file changes.
     """
-    import os
-    import yaml
-
     try:
-        config_path = "./config.yml"
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"config.yml not found at {config_path}.")
-
-        with open(config_path, "r") as config_file:
+        config = get_config()
+        cached = _agent_configs.get(agent_id)
+        if cached is None or cached[0] is not config:
+            cached = _agent_configs[agent_id] = (config, AgentConfig.from_dict(config["agents"][agent_id]))
 
-            config = yaml.safe_load(config_file)
-
-            return config["agents"][agent_id]
+        return cached[1]
 
     except Exception as e:
         raise ValueError(f"Error loading agent configuration: {e}")
 
 
+@dataclass(slots=True, frozen=True)
+class AgentConfig:
+    """
+    The configuration of a single agent, as defined under agents in config.yml.
+    Instances are shared through the config cache, so their collections are made read-only,
+    including the mappings and lists nested inside config.
+    """
+
+    name: str
+    model_provider: str
+    model_name: str | None = None
+    config: Mapping = field(default_factory=dict)
+    tools: tuple = ()
+    history_max: int = 64
+
+    @classmethod
+    def from_dict(cls, agent_config):
+        """
+        Build an AgentConfig from its config.yml entry. Keys that are not fields of AgentConfig,
+        such as a description, are ignored.
+        """
+        return cls(**{f.name: agent_config[f.name] for f in fields(cls) if f.name in agent_config})
+
+    def __post_init__(self):
+        if self.history_max < 1:
+            raise ValueError(f"history_max must be at least 1, got {self.history_max}")
+        object.__setattr__(self, "config", _freeze(self.config))
+        object.__setattr__(self, "tools", tuple(self.tools))
+
+
+def _freeze(value):
+    """
+    Return a read-only copy of a config value, turning mappings into mapping proxies and lists
+    into tuples at every level.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class Agent:
     """
     An LLM connected agent that can process messages and interact with a user or other agents.
-    Each agent maintains a full history of messages and responses.
+    Each agent keeps a bounded history of its most recent messages and responses, set by the
+    optional history_max config key.
     """
 
     def __init__(self, agent_id, agent_config, llm_client, mcp_client):
 
-        self.name = agent_config["name"]
+        self.name = agent_config.name
         self.agent_id = agent_id
         self.config = agent_config
 
         self._llm_client = llm_client
         self._mcp_client = mcp_client
-        self._history = []
+        self._history = None
+        self._mcp_tools = None
+        self._llm_tools = None
 
     async def run(self):
+        """
+        Start the LLM and MCP clients concurrently. If either fails, the other is cancelled. The MCP
+        client starts fetching the available tools in the background.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(asyncio.to_thread(self._llm_client.run))
+                tg.create_task(self._mcp_client.run())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+
+    async def close(self):
+        """
+        Disconnect from the MCP servers.
+        """
+        await self._mcp_client.close()
 
-        self._llm_client.run()
-        await self._mcp_client.run()
+    async def _get_llm_tools(self):
+        """
+        Get the MCP tools converted for the LLM. They are converted again only when the MCP client
+        returns a new tool list, e.g. after a server disconnects or invalidate_tools is called.
+        """
+        mcp_tools = await self._mcp_client.get_tool_list()
+        if mcp_tools is not self._mcp_tools:
+            self._llm_tools = self._llm_client.create_tools(mcp_tools)
+            self._mcp_tools = mcp_tools
+        return self._llm_tools
+
+    def invalidate_tools(self):
+        """
+        Drop the cached tool list so it is fetched from the MCP servers on the next post.
+        """
+        self._mcp_client.invalidate_tools()
 
     async def post(self, message):
         """
-        Post a message to the agent and return the response.
+        Post a message to the agent and stream the text of its response as it arrives.
         """
+        llm_client = self._llm_client
 
-        new_content = self._llm_client.create_content(
+        new_content = llm_client.create_content(
             content=message,
             type="text",
             role="user",
         )
+        if self._history is None:
+            self._history = deque(maxlen=self.config.history_max)
         self._history.append(new_content)
+        # the deque evicts one entry at a time, which can leave a model response at the front
+        # without the user message it answered; the conversation must start with a user turn
+        while self._history[0].role != "user":
+            self._history.popleft()
 
-        mcp_tools = await self._mcp_client.get_tool_list()
-
-        llm_tools = self._llm_client.create_tools(mcp_tools)
+        llm_tools = await self._get_llm_tools()
         # print(llm_tools)
-        response = await self._llm_client.post(
-            contents=self._history, agent_config=self.config, tools=llm_tools
-        )
-        if not response:
-            raise ValueError("No response received from the LLM client.")
-
-        if response.candidates[0].content.parts[0].function_call:
-            function_call = response.candidates[0].content.parts[0].function_call
-
+        response_text = []
+        function_calls = []
+        async for chunk in llm_client.post(
+            contents=list(self._history), agent_config=self.config, tools=llm_tools
+        ):
+            if not chunk.candidates or not chunk.candidates[0].content:
+                continue
+            for part in chunk.candidates[0].content.parts or ():
+                if part.function_call is not None:
+                    function_calls.append(part.function_call)
+                elif part.text:
+                    response_text.append(part.text)
+                    yield part.text
+
+        # Call the MCP server for each predicted tool, in the order the LLM requested them
+        for function_call in function_calls:
             session = await self._mcp_client.get_tool_session(function_call.name)
-            if not session:
-                raise ValueError(f"Session for tool {function_call.name} not found.")
-            # Call the MCP server with the predicted tool
             result = await session.call_tool(function_call.name, arguments=function_call.args)
-            response = result.content[0]
+            text = result.content[0].text
+            if response_text:
+                text = "\n" + text
+            response_text.append(text)
+            yield text
+
+        if not response_text:
+            raise ValueError("No response received from the LLM client.")
 
-        content = self._llm_client.create_content(
-            content=response.text,
+        content = llm_client.create_content(
+            content="".join(response_text),
             type="text",
             role="model",
         )
         self._history.append(content)
-        return content
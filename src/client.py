@@ -1,7 +1,14 @@
 __all__ = ["get_client"]
+import sys
+import asyncio
+import threading
 
 from src.agent import get_agent
 
+exit_commands = frozenset(["exit", "quit"])
+output_flush_size = 4096
+output_flush_interval = 0.05
+
 
 def get_client(agent_id="chat"):
     """
@@ -10,6 +17,36 @@ def get_client(agent_id="chat"):
     return Client(agent_id=agent_id)
 
 
+async def read_input(prompt):
+    """
+    Read a line from stdin on a daemon thread so the event loop keeps running while the user types.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read():
+        try:
+            result, error = input(prompt), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The loop was closed while waiting for input.
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 class Client:
     """
     Command Line Interface (CLI), with a built in agent to interact with
@@ -26,30 +63,60 @@ class Client:
         await self.agent.run()
         print(f"Connected to {self.agent.name}.")
 
+    async def close(self):
+        """
+        Disconnect the agent from its tools.
+        """
+        if self.agent is not None:
+            await self.agent.close()
+
     async def get_user_message(self):
-        message = input("You: ")
-        if message.lower() in ["exit", "quit"]:
-            raise KeyboardInterrupt
-        elif not message:
+        while True:
+            message = await read_input("You: ")
+            if len(message) == 4 and message.lower() in exit_commands:
+                raise KeyboardInterrupt
+            elif message:
+                print(f"You: {message}")
+                return message
             print("Please enter a message.")
-            return await self.get_user_message()
-        else:
-            print(f"You: {message}")
-        return message
 
-    async def post(self, message):
+    def post(self, message):
         """
-        Post a message to the agent and return the response.
+        Post a message to the agent and return an async iterator over the response text.
         """
-        response = await self.agent.post(message)
-        return response
+        return self.agent.post(message)
 
     async def get_agent_message(self, response):
         """
-        Get the agent's message from the response.
+        Print the agent's message as the streamed response arrives. Output is flushed at line
+        ends, once enough text is pending, or shortly after the last unflushed write.
         """
-        message = f"{self.agent.name}: "
-        for part in response.parts:
-            if part.text:
-                message += part.text
-        print(message, end="\n", flush=True)
+        loop = asyncio.get_running_loop()
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        pending = 0
+        timer = None
+
+        def flush_pending():
+            nonlocal pending, timer
+            pending = 0
+            timer = None
+            flush()
+
+        write(f"{self.agent.name}: ")
+        flush()
+        try:
+            async for text in response:
+                write(text)
+                pending += len(text)
+                if pending >= output_flush_size or "\n" in text:
+                    if timer is not None:
+                        timer.cancel()
+                    flush_pending()
+                elif timer is None:
+                    timer = loop.call_later(output_flush_interval, flush_pending)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            write("\n")
+            flush()
@@ -0,0 +1,50 @@
+__all__ = ["get_config"]
+import os
+import functools
+
+config_path = "./config.yml"
+
+
+def get_config():
+    """
+    Get the parsed config.yml from the project root. The file is parsed once and the same object is
+    returned until its modification time changes.
+    """
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"config.yml not found at {config_path}.")
+
+    return _load_config(config_path, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(config_path: str, mtime: int):
+    """
+    Parse the YAML config file. When RUBBERDUCK_CONFIG_PICKLE is set, the parsed config is also
+    stored in a pickle next to the file and reused until the YAML file is modified again.
+    """
+    import yaml
+
+    pickle_path = config_path + ".pkl"
+    use_pickle = bool(os.getenv("RUBBERDUCK_CONFIG_PICKLE"))
+
+    if use_pickle:
+        import pickle
+
+        if os.path.exists(pickle_path) and os.path.getmtime(pickle_path) >= os.path.getmtime(
+            config_path
+        ):
+            with open(pickle_path, "rb") as pickle_file:
+                return pickle.load(pickle_file)
+
+    with open(config_path, "r") as config_file:
+        config = yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    if use_pickle:
+        tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as pickle_file:
+            pickle.dump(config, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+
+    return config
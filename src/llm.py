@@ -1,14 +1,17 @@
 __all__ = ["get_llm_client"]
 
 import os
+import functools
 import mimetypes
 from abc import ABC, abstractmethod
+import httpx
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
 default_model_name = "gemini-2.0-flash"
 default_config = types.GenerateContentConfigDict()
+unsupported_schema_keys = frozenset(["additionalProperties", "$schema"])
 
 
 def get_llm_client(agent_id):
@@ -22,6 +25,29 @@ def get_llm_client(agent_id):
         raise ValueError(f"Unsupported model provider: {agent_id}")
 
 
+@functools.cache
+def load_env():
+    """
+    Load environment variables from .env once per process.
+    """
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=4)
+def get_genai_client(api_key):
+    """
+    Get a Google GenAI client for the API key, shared by every LLM client in the process.
+    Its async HTTP client keeps a pool of HTTP/2 connections open between requests.
+    """
+    http_options = types.HttpOptions(
+        async_client_args={
+            "limits": httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            "http2": True,
+        }
+    )
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
 class LLMClient(ABC):
     """
     Abstract base class for LLM clients.
@@ -36,11 +62,11 @@ class LLMClient(ABC):
         pass
 
     @abstractmethod
-    def create_tools(self, content, type="text", role="user"):
+    def create_tools(self, tools):
         pass
 
     @abstractmethod
-    async def post(self, contents, config={}, tools=None):
+    async def post(self, contents, agent_config, tools=None):
         pass
 
 
@@ -51,30 +77,36 @@ class GoogleLLMClient(LLMClient):
 
     def __init__(self):
         self.client = None
+        self._generate_config = (None, None, None)
 
     def run(self):
         """
         Get the Google GenAI client.
         """
-        load_dotenv()
+        if self.client:
+            return
+
+        load_env()
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError(
                 "API key not found. Please set the GOOGLE_API_KEY environment variable."
             )
 
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_genai_client(api_key)
 
     def create_content(self, content, type="text", role="user"):
         """Convert content into the proper format."""
         if type == "text":
             return types.Content(parts=[types.Part.from_text(text=content)], role=role)
         elif type == "file":
-            (mime_type, _encoding) = mimetypes.guess_type(content)
+            mime_type = mimetypes.types_map.get(os.path.splitext(content)[1].lower())
+            if mime_type is None:
+                (mime_type, _encoding) = mimetypes.guess_type(content)
             if mime_type is None:
                 raise ValueError(f"Could not determine MIME type for file: {content}")
             return types.Content(
-                role, parts=[types.Part.from_uri(file_uri=content, mime_type=mime_type)]
+                role=role, parts=[types.Part.from_uri(file_uri=content, mime_type=mime_type)]
             )
         else:
             raise ValueError(f"Unsupported message type: {type}")
@@ -83,38 +115,56 @@ class GoogleLLMClient(LLMClient):
         """Convert tools from MCP to Gemini format."""
         llm_tools = []
         for tool in tools:
-            parameters = {}
-            for key, value in tool.inputSchema.items():
-                if key not in ["additionalProperties", "$schema"]:
-                    parameters[key] = value
-            try:
-                llm_tool = types.Tool(
-                    function_declarations=[
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": parameters,
-                        }
-                    ]
-                )
+            llm_tool = self._create_tool(tool)
+            if llm_tool is not None:
                 llm_tools.append(llm_tool)
-            except Exception:
-                continue
 
         return llm_tools
 
-    async def post(self, contents, agent_config={}, tools=None):
-        """Post contents to the Google GenAI client. Use create_content to format content before posting."""
-        merged_config = default_config | agent_config.get("config", {})
+    def _create_tool(self, tool):
+        """Convert a single MCP tool to Gemini format, or return None if it is not supported."""
+        parameters = {
+            key: value
+            for key, value in tool.inputSchema.items()
+            if key not in unsupported_schema_keys
+        }
+        try:
+            return types.Tool(
+                function_declarations=[
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": parameters,
+                    }
+                ]
+            )
+        except Exception:
+            return None
 
+    async def post(self, contents, agent_config, tools=None):
+        """Post contents to the Google GenAI client and yield response chunks as they are streamed.
+        Use create_content to format content before posting."""
         if not contents:
             raise ValueError("No contents provided to post.")
 
-        # Pass tools_to_pass as a separate argument to generate_content
-        response = await self.client.aio.models.generate_content(
-            model=agent_config.get("model_name", default_model_name),
+        # Pass tools_to_pass as a separate argument to generate_content_stream
+        stream = await self.client.aio.models.generate_content_stream(
+            model=agent_config.model_name or default_model_name,
             contents=contents,
-            config=types.GenerateContentConfig(**merged_config, tools=tools),
+            config=self._get_generate_config(agent_config, tools),
         )
+        async for chunk in stream:
+            yield chunk
+
+    def _get_generate_config(self, agent_config, tools):
+        """
+        Build the request config for an agent and tool list, reusing the last one while both are
+        unchanged.
+        """
+        (cached_agent_config, cached_tools, generate_config) = self._generate_config
+        if cached_agent_config is not agent_config or cached_tools is not tools:
+            merged_config = default_config | agent_config.config
+            generate_config = types.GenerateContentConfig(**merged_config, tools=tools)
+            self._generate_config = (agent_config, tools, generate_config)
 
-        return response
+        return generate_config
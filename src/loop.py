@@ -0,0 +1,18 @@
+__all__ = ["new_event_loop"]
+import sys
+import asyncio
+
+
+def new_event_loop():
+    """
+    Create the event loop that drives the application, using uvloop when it is available.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return uvloop.new_event_loop()
+        except ImportError:
+            pass
+
+    return asyncio.new_event_loop()
@@ -6,21 +6,17 @@ async def run():
     """
     Starts the conversation loop between the user and agent(s).
     """
+    client = get_client()
     try:
-        client = get_client()
         await client.run()
 
         while True:
             user_message = await client.get_user_message()
 
-            if user_message.lower() in ["exit", "quit"]:
-                raise KeyboardInterrupt
+            # Process the user message, printing the response as it streams in
+            await client.get_agent_message(client.post(user_message))
 
-            # Process the user message
-            response = await client.post(user_message)
-            await client.get_agent_message(response)
-
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\nGoodbye!")
         exit(0)
     except EOFError:
@@ -29,7 +25,5 @@ async def run():
     except Exception as e:
         print(f"An error occurred: {e}")
         exit(1)
-
-
-if __name__ == "__main__":
-    asyncio.run(run("main"))
+    finally:
+        await client.close()
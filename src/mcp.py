@@ -1,10 +1,11 @@
 __all__ = ["get_mcp"]
-import os
-import yaml
 import asyncio
+import anyio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from contextlib import AsyncExitStack
+from src.config import get_config
+
+_server_params = {}
 
 
 def get_mcp(agent_id="chat"):
@@ -19,26 +20,22 @@ def get_mcp(agent_id="chat"):
 def get_mcp_servers(agent_id: str):
     """
     Get the configuration for a given agent_id (key) from the agent_config.yml file at the project root.
+    The result is cached until the file changes.
     """
-
     try:
-        config_path = "./config.yml"
-        server_params = []
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"config.yml not found at {config_path}.")
-
-        tool_names = []
-        with open(config_path, "r") as config_file:
-            config = yaml.safe_load(config_file)
+        config = get_config()
+        cached = _server_params.get(agent_id)
+        if cached is None or cached[0] is not config:
             mcp_servers = config["mcp_servers"]
-            tool_names = config["agents"][agent_id]["tools"]
+            server_params = []
+            for tool_name in config["agents"][agent_id].get("tools", ()):
+                if tool_name in mcp_servers:
+                    server_params.append(StdioServerParameters(**mcp_servers[tool_name]))
+                else:
+                    raise ValueError(f"Tool {tool_name} not found in MCP tools configuration.")
+            cached = _server_params[agent_id] = (config, tuple(server_params))
 
-        for tool_name in tool_names:
-            if tool_name in mcp_servers:
-                server_params.append(StdioServerParameters(**mcp_servers[tool_name]))
-            else:
-                raise ValueError(f"Tool {tool_name} not found in MCP tools configuration.")
-        return server_params
+        return cached[1]
 
     except Exception as e:
         raise ValueError(f"Error loading agent configuration: {e}")
@@ -50,59 +47,148 @@ class MCP:
     """
 
     def __init__(self, server_params):
-        self.exit_stack = AsyncExitStack()
         self.server_params = server_params
         self.sessions = []
         self._tool_session_map = {}
+        self._tool_list_task = None
+        self._server_tasks = []
+        self._closed = asyncio.Event()
 
     async def run(self):
         """
-        Connect to an MCP server
-
-        Args:
-            server_script_path: Path to the server script (.py or .js)
+        Connect to all configured MCP servers concurrently.
         """
+        if self.sessions:
+            return
 
         try:
-            for server in self.server_params:
-                stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server))
-                (self.stdio, self.write) = stdio_transport
-                session = await self.exit_stack.enter_async_context(
-                    ClientSession(
-                        read_stream=self.stdio,
-                        write_stream=self.write,
-                    )
-                )
-                self.sessions.append(session)
-            # initialize all sessions at once async
-            await asyncio.gather(*[session.initialize() for session in self.sessions])
+            loop = asyncio.get_running_loop()
+            ready = [loop.create_future() for _ in self.server_params]
+            self._server_tasks = [
+                asyncio.create_task(self._serve(server, session_ready))
+                for server, session_ready in zip(self.server_params, ready)
+            ]
+            results = await asyncio.gather(*ready, return_exceptions=True)
+            for server, result in zip(self.server_params, results):
+                if isinstance(result, Exception):
+                    print(f"Failed to connect to MCP server {server.command}: {result}")
+                else:
+                    self.sessions.append(result)
+            # start indexing tools right away so the first lookup does not pay for it
+            self._start_tool_list()
             print("Connected to MCP servers.")
         except Exception as e:
             print(f"Failed to connect to MCP server: {e}")
 
+    async def close(self):
+        """
+        Disconnect from all MCP servers.
+        """
+        self._closed.set()
+        await asyncio.gather(*self._server_tasks, return_exceptions=True)
+        self._server_tasks = []
+        self.sessions = []
+        self._tool_list_task = None
+        self._closed = asyncio.Event()
+
+    async def _serve(self, server, session_ready):
+        """
+        Hold the connection to one MCP server open until the client is closed. The transport is
+        entered and exited in this task, since its task group must not cross tasks. The session is
+        initialized before it is handed out, so a server that refuses fails only its own connection.
+        """
+        try:
+            async with stdio_client(server) as (server_stream, write_stream):
+                writer, read_stream = anyio.create_memory_object_stream(0)
+                disconnected = asyncio.create_task(_forward(server_stream, writer))
+                try:
+                    async with ClientSession(
+                        read_stream=read_stream,
+                        write_stream=write_stream,
+                    ) as session:
+                        await session.initialize()
+                        session_ready.set_result(session)
+                        closed = asyncio.create_task(self._closed.wait())
+                        await asyncio.wait((closed, disconnected), return_when=asyncio.FIRST_COMPLETED)
+                        closed.cancel()
+                        if not self._closed.is_set():
+                            raise ConnectionError("the server closed the connection")
+                finally:
+                    disconnected.cancel()
+        except Exception as e:
+            while isinstance(e, ExceptionGroup):
+                # the transport's task group wraps the error that closed it
+                e = e.exceptions[0]
+            if not session_ready.done():
+                session_ready.set_exception(e)
+            elif not (self._closed.is_set() or session_ready.cancelled()):
+                # The server went away after connecting; stop routing tool calls to it.
+                session = session_ready.result()
+                if session in self.sessions:
+                    self.sessions.remove(session)
+                self.invalidate_tools()
+                print(f"Lost connection to MCP server {server.command}: {e}")
+
     async def get_tool_list(self):
         """
-        Get the list of tools available in MCP server sessions.
+        Get the list of tools available in MCP server sessions. The list is fetched from all
+        sessions concurrently on first use and cached until invalidate_tools is called.
         """
-        tools = []
+        task = self._tool_list_task
+        if task is None:
+            task = self._start_tool_list()
+        return await task
 
-        for session in self.sessions:
-            if not session:
-                raise RuntimeError("MCP sessions are not initialized. Please run the server first.")
+    def _start_tool_list(self):
+        """
+        Start fetching the tool list in the background. A failed fetch is not cached, so the next
+        get_tool_list call tries again.
+        """
+        task = self._tool_list_task = asyncio.create_task(self._list_tools())
 
-            session_list = await session.list_tools()
+        def forget_failure(task):
+            if (task.cancelled() or task.exception() is not None) and self._tool_list_task is task:
+                self._tool_list_task = None
 
-            for tool in session_list.tools:
-                tools.append(tool)
-                self._tool_session_map[tool.name] = session
+        task.add_done_callback(forget_failure)
+        return task
 
-        return tools
+    def invalidate_tools(self):
+        """
+        Drop the cached tool list so it is fetched from the MCP servers on next use.
+        """
+        self._tool_list_task = None
+
+    async def _list_tools(self):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(session.list_tools()) for session in self.sessions]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+        session_lists = [task.result() for task in tasks]
+        self._tool_session_map = {
+            tool.name: session
+            for session, session_list in zip(self.sessions, session_lists)
+            for tool in session_list.tools
+        }
+        return [tool for session_list in session_lists for tool in session_list.tools]
 
     async def get_tool_session(self, tool_name):
         """
-        Get the session for a specific tool.
+        Get the session for a specific tool, waiting for the tool index if it is still loading.
         """
+        await self.get_tool_list()
         if tool_name in self._tool_session_map:
             return self._tool_session_map[tool_name]
         else:
             raise ValueError(f"Tool {tool_name} not found in MCP sessions.")
+
+
+async def _forward(server_stream, writer):
+    """
+    Pass messages from an MCP server to its session. Returns once the server closes its output,
+    which the stdio transport does not report as an error.
+    """
+    async with writer:
+        async for message in server_stream:
+            await writer.send(message)
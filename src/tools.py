@@ -1,6 +1,14 @@
-def read_file(file_path: str) -> str:
+import os
+import asyncio
+from pathlib import Path
+
+small_file_size = 64 * 1024
+
+
+async def read_file(file_path: str) -> str:
     """
-    Read the contents of a file and return it as a string.
+    Read the contents of a UTF-8 encoded file and return it as a string.
+    The read runs in a worker thread so it does not block the event loop.
     Args:
         file_path (str): The path to the file to read.
     Returns:
@@ -9,30 +17,62 @@ def read_file(file_path: str) -> str:
         FileNotFoundError: If the file does not exist.
         IOError: If there is an error reading the file.
     """
-    try:
-        with open(file_path, "r") as f:
-            return f.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(f"File not found: {file_path}")
-    except IOError:
-        raise IOError(f"Error reading file: {file_path}")
-    except Exception as e:
-        raise Exception(f"An error occurred while reading the file: {e}")
+    return await asyncio.to_thread(_read_file_sync, file_path)
 
 
-def write_file(file_path: str, content: str) -> None:
+async def write_file(file_path: str, content: str) -> None:
     """
-    Write content to a file.
+    Write content to a UTF-8 encoded file, creating its parent directories if needed.
+    The write runs in a worker thread so it does not block the event loop.
     Args:
         file_path (str): The path to the file to write.
         content (str): The content to write to the file.
     Raises:
         IOError: If there is an error writing to the file.
     """
+    await asyncio.to_thread(_write_file_sync, file_path, content)
+
+
+def _read_file_sync(file_path: str) -> str:
     try:
-        with open(file_path, "w") as f:
-            f.write(content)
+        return _read_bytes(file_path).decode("utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    except IOError:
+        raise IOError(f"Error reading file: {file_path}")
+    except Exception as e:
+        raise Exception(f"An error occurred while reading the file: {e}")
+
+
+def _write_file_sync(file_path: str, content: str) -> None:
+    try:
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
     except IOError:
         raise IOError(f"Error writing to file: {file_path}")
     except Exception as e:
         raise Exception(f"An error occurred while writing to the file: {e}")
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """
+    Read a file's bytes with raw os.read calls when it is small, skipping the buffered io stack.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size >= small_file_size:
+            with open(fd, "rb", closefd=False) as f:
+                return f.read()
+
+        data = os.read(fd, size)
+        if size and len(data) == size:
+            return data
+        # a short read is not EOF on every filesystem, so keep reading until os.read returns nothing
+        chunks = [data]
+        while chunk := os.read(fd, small_file_size):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)